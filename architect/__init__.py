@@ -1,21 +1,39 @@
+from .errors import SourceMap
 from .frontend.lexer import tokenize
 from .frontend.parser import Parser
 from .runtime.interpreter import evaluate
 from .runtime.values import Environment
+from .runtime.cache import ExpressionCache
+from .instrumentation import MemoryProfiler, measure
 
-def execute_code(text):
+def execute_code(text, profiler=None, cache=None):
     global_environment = Environment()
-    rt = tokenize(text)
+    source_map = SourceMap(text)
+    with measure(profiler, "lex"):
+        rt = tokenize(text)
     if rt.error:
-        rt.error.show_error()
+        rt.error.show_error(source_map)
     
-    parser = Parser(rt.result)
-    rt = parser.produce_ast()
+    with measure(profiler, "parse"):
+        parser = Parser(rt.result)
+        rt = parser.produce_ast()
     if rt.error:
-        rt.error.show_error()
+        rt.error.show_error(source_map)
     print(rt.result)
-    rt = evaluate(rt.result, global_environment)
+    with measure(profiler, "eval"):
+        rt = evaluate(rt.result, global_environment, cache)
     if rt.error:
-        rt.error.show_error()
+        rt.error.show_error(source_map)
     
-    print(rt.result)
\ No newline at end of file
+    print(rt.result)
+
+def check_code(text):
+    # lex and parse without stopping at the first error, returns every diagnostic found with its line and column
+    errors = []
+    rt = tokenize(text, errors)
+    parser = Parser(rt.result, errors)
+    parser.produce_ast()
+    source_map = SourceMap(text)
+    # lexer errors are collected before parser errors, put them back in source order
+    errors = sorted(errors, key=lambda error: (error.position is None, error.position or 0))
+    return [error.as_string(source_map) for error in errors]
\ No newline at end of file
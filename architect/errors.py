@@ -1,18 +1,40 @@
 import sys
+from bisect import bisect_right
 
 # Base class
 class ErrorType:
     def __init__(self, type):
         self.type = type
 
+class SourceMap:
+    def __init__(self, text):
+        self.text = text
+        self.line_starts = None
+    
+    def locate(self, position):
+        # the line-start index is only built once an error actually needs it
+        if self.line_starts is None:
+            self.line_starts = [0] + [index + 1 for index, character in enumerate(self.text) if character == "\n"]
+        
+        line = bisect_right(self.line_starts, position)
+        return line, position - self.line_starts[line - 1] + 1
+
 class Error:
-    def __init__(self, error, reason, error_code):
+    def __init__(self, error, reason, error_code, position=None):
         self.error = error
         self.reason = reason
         self.error_code = error_code
+        self.position = position
+    
+    def as_string(self, source_map=None):
+        if self.position is None or source_map is None:
+            return f"{self.error.type}: {self.reason}"
+        
+        line, column = source_map.locate(self.position)
+        return f"{self.error.type}: {self.reason} (line {line}, column {column})"
     
-    def show_error(self):
-        sys.stdout.write(f"{self.error.type}: {self.reason}")
+    def show_error(self, source_map=None):
+        sys.stdout.write(self.as_string(source_map))
         sys.exit(self.error_code)
 
 class RuntimeResult:
@@ -22,22 +44,22 @@ class RuntimeResult:
 
 # Errors
 class SyntaxError(Error):
-    def __init__(self, reason):
-        super().__init__(ErrorType("SyntaxError"), reason, 1)
+    def __init__(self, reason, position=None):
+        super().__init__(ErrorType("SyntaxError"), reason, 1, position)
 
 class VariableError(Error):
-    def __init__(self, reason):
-        super().__init__(ErrorType("VariableError"), reason, 2)
+    def __init__(self, reason, position=None):
+        super().__init__(ErrorType("VariableError"), reason, 2, position)
 
 class MathError(Error):
-    def __init__(self, reason):
-        super().__init__(ErrorType("MathError"), reason, 3)
+    def __init__(self, reason, position=None):
+        super().__init__(ErrorType("MathError"), reason, 3, position)
 
 class DataTypeError(Error):
-    def __init__(self, reason):
-        super().__init__(ErrorType("DataTypeError"), reason, 4)
+    def __init__(self, reason, position=None):
+        super().__init__(ErrorType("DataTypeError"), reason, 4, position)
 
 # Development errors
 class InterpreterError(Error):
-    def __init__(self, reason):
-        super().__init__(ErrorType("InterpreterError"), reason)
\ No newline at end of file
+    def __init__(self, reason, position=None):
+        super().__init__(ErrorType("InterpreterError"), reason, 5, position)
\ No newline at end of file
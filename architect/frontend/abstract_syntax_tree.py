@@ -3,24 +3,25 @@ class NodeType:
         self.type = type
 
 class Statement:
-    def __init__(self, type):
+    def __init__(self, type, position=None):
         self.type = type
+        self.position = position
 
 class Program(Statement):
-    def __init__(self, body):
-        super().__init__(NodeType("Program"))
+    def __init__(self, body, position=None):
+        super().__init__(NodeType("Program"), position)
         self.body = body
     
     def __repr__(self):
         return f"(PROGRAM STATEMENT [\n\t{';\n\t'.join([statement.__repr__() for statement in self.body])}\n])"
 
 class Expression(Statement):
-    def __init__(self, type):
-        super().__init__(type)
+    def __init__(self, type, position=None):
+        super().__init__(type, position)
 
 class BinaryExpression(Expression):
-    def __init__(self, left, operator, right):
-        super().__init__(NodeType("BinaryExpression"))
+    def __init__(self, left, operator, right, position=None):
+        super().__init__(NodeType("BinaryExpression"), position)
         self.left = left
         self.operator = operator
         self.right = right
@@ -29,8 +30,8 @@ class BinaryExpression(Expression):
         return f"(BINARY EXPRESSION {self.left} {self.operator} {self.right})"
 
 class UnaryExpression(Expression):
-    def __init__(self, sign, value):
-        super().__init__(NodeType("UnaryExpression"))
+    def __init__(self, sign, value, position=None):
+        super().__init__(NodeType("UnaryExpression"), position)
         self.sign = sign
         self.value = value
     
@@ -38,47 +39,47 @@ class UnaryExpression(Expression):
         return f"(UNARY EXPRESSION {self.sign}{self.value})"
 
 class NumberLiteral(Expression):
-    def __init__(self, value):
-        super().__init__(NodeType("NumberLiteral"))
+    def __init__(self, value, position=None):
+        super().__init__(NodeType("NumberLiteral"), position)
         self.value = value
     
     def __repr__(self):
         return f"(NUMBER LITERAL {self.value})"
 
 class BooleanLiteral(Expression):
-    def __init__(self, value):
-        super().__init__(NodeType("BooleanLiteral"))
+    def __init__(self, value, position=None):
+        super().__init__(NodeType("BooleanLiteral"), position)
         self.value = value
     
     def __repr__(self):
         return f"(BOOLEAN LITERAL {self.value})"
 
 class TrueLiteral(BooleanLiteral):
-    def __init__(self):
-        super().__init__("true")
+    def __init__(self, position=None):
+        super().__init__("true", position)
     
 class FalseLiteral(BooleanLiteral):
-    def __init__(self):
-        super().__init__("false")
+    def __init__(self, position=None):
+        super().__init__("false", position)
 
 class NullLiteral(Expression):
-    def __init__(self):
-        super().__init__(NodeType("NullLiteral"))
+    def __init__(self, position=None):
+        super().__init__(NodeType("NullLiteral"), position)
     
     def __repr__(self) -> str:
         return "(NULL LITERAL)"
 
 class Identifier(Expression):
-    def __init__(self, var_name):
-        super().__init__(NodeType("Identifier"))
+    def __init__(self, var_name, position=None):
+        super().__init__(NodeType("Identifier"), position)
         self.var_name = var_name
     
     def __repr__(self):
         return f"(IDENTIFIER {self.var_name})"
 
 class AssignmentStatement(Statement):
-    def __init__(self, var_name, value):
-        super().__init__(NodeType("AssignmentStatement"))
+    def __init__(self, var_name, value, position=None):
+        super().__init__(NodeType("AssignmentStatement"), position)
         self.var_name = var_name
         self.value = value
 
@@ -86,10 +87,20 @@ class AssignmentStatement(Statement):
         return f"(ASSIGNMENT STATEMENT: {self.var_name} assigned with {self.value})"
 
 class UpdateStatement(Statement):
-    def __init__(self, var_name, value):
-        super().__init__(NodeType("UpdateStatement"))
+    def __init__(self, var_name, value, position=None):
+        super().__init__(NodeType("UpdateStatement"), position)
         self.var_name = var_name
         self.value = value
     
     def __repr__(self):
         return f"(UPDATE STATEMENT: {self.var_name} updated with {self.value})"
+
+class IfStatement(Statement):
+    def __init__(self, condition, body, else_body, position=None):
+        super().__init__(NodeType("IfStatement"), position)
+        self.condition = condition
+        self.body = body
+        self.else_body = else_body
+    
+    def __repr__(self):
+        return f"(IF STATEMENT: {self.condition} then [{'; '.join([statement.__repr__() for statement in self.body])}] else [{'; '.join([statement.__repr__() for statement in self.else_body])}])"
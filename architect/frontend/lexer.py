@@ -11,9 +11,10 @@ class TokenType:
         return f"(TOKEN TYPE {self.type})"
 
 class Token:
-    def __init__(self, type, value=None):
+    def __init__(self, type, value=None, position=None):
         self.type = type
         self.value = value
+        self.position = position
     
     def __repr__(self):
         return f"(TOKEN {self.type.__repr__()}{f' with value {self.value}'})"
@@ -29,36 +30,39 @@ KEYWORDS = {
     "null": TokenType("Null"),
     "decision": TokenType("Decision"),
     "if": TokenType("If"),
-    "else": TokenType("Else")
+    "else": TokenType("Else"),
+    "end": TokenType("End")
 }
 
-def tokenize(text):
+def tokenize(text, errors=None):
     src = list(text)
     tokens = []
     while src:
+        # offset of src[0] in the original text
+        position = len(text) - len(src)
         match src[0]:
             case "$":
                 # repeat until the newline
                 while src[0] != "\n":
                     src.pop(0)
                     if not src:
-                        return RuntimeResult(tokens + [Token(TokenType("EOF"))], None)
+                        return RuntimeResult(tokens + [Token(TokenType("EOF"), None, len(text))], None)
             case "+":
-                tokens += [Token(TokenType("Plus"), src.pop(0))]
+                tokens += [Token(TokenType("Plus"), src.pop(0), position)]
             case "-":
-                tokens += [Token(TokenType("Minus"), src.pop(0))]
+                tokens += [Token(TokenType("Minus"), src.pop(0), position)]
             case "*":
-                tokens += [Token(TokenType("Multiply"), src.pop(0))]
+                tokens += [Token(TokenType("Multiply"), src.pop(0), position)]
             case "/":
-                tokens += [Token(TokenType("Divide"), src.pop(0))]
+                tokens += [Token(TokenType("Divide"), src.pop(0), position)]
             case "^":
-                tokens += [Token(TokenType("Power"), src.pop(0))]
+                tokens += [Token(TokenType("Power"), src.pop(0), position)]
             case "(":
-                tokens += [Token(TokenType("OpenParen"), src.pop(0))]
+                tokens += [Token(TokenType("OpenParen"), src.pop(0), position)]
             case ")":
-                tokens += [Token(TokenType("CloseParen"), src.pop(0))]
+                tokens += [Token(TokenType("CloseParen"), src.pop(0), position)]
             case "\n":
-                tokens += [Token(TokenType("Newline"), src.pop(0))]
+                tokens += [Token(TokenType("Newline"), src.pop(0), position)]
             case _:
                 if src[0] in "\t ":
                     src.pop(0)
@@ -73,9 +77,14 @@ def tokenize(text):
                     
                     count = number.count(".")
                     if count > 1:
-                        return RuntimeResult(None, SyntaxError(f"Expected 0 or 1 '.' in a number, got {count}/1"))
+                        error = SyntaxError(f"Expected 0 or 1 '.' in a number, got {count}/1", position)
+                        if errors is None:
+                            return RuntimeResult(None, error)
+                        
+                        errors += [error]
+                        continue
                     
-                    tokens += [Token(TokenType("Number"), number)]
+                    tokens += [Token(TokenType("Number"), number, position)]
                     continue
                 
                 if src[0] in LETTERS:
@@ -86,12 +95,18 @@ def tokenize(text):
                             break
                     
                     if identifier in KEYWORDS:
-                        tokens += [Token(KEYWORDS[identifier], identifier)]
+                        tokens += [Token(KEYWORDS[identifier], identifier, position)]
                         continue
 
-                    tokens += [Token(TokenType("Identifier"), identifier)]
+                    tokens += [Token(TokenType("Identifier"), identifier, position)]
                     continue
 
-                return RuntimeResult(None, SyntaxError(f"Unexpected character: '{src[0]}'"))
+                error = SyntaxError(f"Unexpected character: '{src[0]}'", position)
+                if errors is None:
+                    return RuntimeResult(None, error)
+                
+                # keep lexing past the bad character so every diagnostic is reported
+                errors += [error]
+                src.pop(0)
     
-    return RuntimeResult(tokens + [Token(TokenType("EOF"))], None)
\ No newline at end of file
+    return RuntimeResult(tokens + [Token(TokenType("EOF"), None, len(text))], None)
\ No newline at end of file
@@ -2,8 +2,9 @@ from .abstract_syntax_tree import *
 from ..errors import RuntimeResult, SyntaxError
 
 class Parser:
-    def __init__(self, tokens):
+    def __init__(self, tokens, errors=None):
         self.tokens = tokens
+        self.errors = errors
     
     def at(self):
         return self.tokens[0]
@@ -12,14 +13,15 @@ class Parser:
         return self.tokens.pop(0)
     
     def expect(self, *expected, error):
-        token = self.tokens.pop(0)
+        token = self.at()
         if token.type.type not in expected:
+            # the token is left in place so recovery can resynchronise on it
             if self.in_end(token):
-                return RuntimeResult(None, error)
+                return RuntimeResult(None, SyntaxError(error.reason, token.position))
             
-            return RuntimeResult(None, SyntaxError(f"{error.reason}, got '{token.value}'"))
+            return RuntimeResult(None, SyntaxError(f"{error.reason}, got '{token.value}'", token.position))
         
-        return RuntimeResult(token, None)
+        return RuntimeResult(self.eat(), None)
 
     def in_end(self, token):
         return token.type.type in ("EOF", "Newline")
@@ -27,23 +29,45 @@ class Parser:
     def not_eof(self):
         return self.at().type.type != "EOF"
 
+    def synchronize(self):
+        # skip the rest of the broken line
+        while not self.in_end(self.at()):
+            self.eat()
+
     def produce_ast(self):
-        program = Program([])
-        while self.not_eof():
-            rt = self.parse_statement()
-            if rt.error:
-                return RuntimeResult(None, rt.error)
-            
-            program.body += [rt.result]
+        position = self.at().position
+        rt = self.parse_block("EOF")
+        if rt.error:
+            return RuntimeResult(None, rt.error)
+
+        return RuntimeResult(Program(rt.result, position), None)
+
+    def parse_block(self, *terminators):
+        body = []
+        while True:
             while self.at().type.type == "Newline":
                 self.eat()
-
-        return RuntimeResult(program, None)
+            
+            if self.at().type.type in terminators:
+                return RuntimeResult(body, None)
+            
+            if not self.not_eof():
+                return RuntimeResult(None, SyntaxError("Expected 'end'", self.at().position))
+            
+            rt = self.parse_statement()
+            if rt.error:
+                if self.errors is None:
+                    return RuntimeResult(None, rt.error)
+                
+                self.errors += [rt.error]
+                self.synchronize()
+            else:
+                body += [rt.result]
 
     def parse_statement(self):
         match self.at().type.type:
             case "Build":
-                self.eat()
+                position = self.eat().position
 
                 # choose type to build
                 rt = self.expect("Frame", error=SyntaxError("Expected 'frame'"))
@@ -53,20 +77,20 @@ class Parser:
                 match rt.result.type.type:
                     case "Frame":
                         # variable
-                        rt = self.parse_build_frame_statement()
+                        rt = self.parse_build_frame_statement(position)
                         if rt.error:
                             return RuntimeResult(None, rt.error)
                         
                         return RuntimeResult(rt.result, None)
             case "Fix":
-                self.eat()
+                position = self.eat().position
                 rt = self.expect("Frame", error=SyntaxError("Expected 'frame'"))
                 if rt.error:
                     return RuntimeResult(None, rt.error)
                 
                 match rt.result.type.type:
                     case "Frame":
-                        rt = self.parse_fix_frame_statement()
+                        rt = self.parse_fix_frame_statement(position)
                         if rt.error:
                             return RuntimeResult(None, rt.error)
                         
@@ -84,8 +108,11 @@ class Parser:
                 
                 return RuntimeResult(rt.result, None)
     
-    def parse_build_frame_statement(self):
+    def parse_build_frame_statement(self, position):
         rt = self.expect("Identifier", error=SyntaxError("Expected identifier"))
+        if rt.error:
+            return RuntimeResult(None, rt.error)
+        
         identifier = rt.result.value
 
         rt = self.expect("With", error=SyntaxError("Expected 'with'"))
@@ -101,12 +128,15 @@ class Parser:
             return RuntimeResult(None, rt.error)
         
         if not self.in_end(self.at()):
-            return RuntimeResult(None, SyntaxError(f"Expected newline, got '{self.at().type.type}'"))
+            return RuntimeResult(None, SyntaxError(f"Expected newline, got '{self.at().type.type}'", self.at().position))
         
-        return RuntimeResult(AssignmentStatement(identifier, rt.result), None)
+        return RuntimeResult(AssignmentStatement(identifier, rt.result, position), None)
 
-    def parse_fix_frame_statement(self):
+    def parse_fix_frame_statement(self, position):
         rt = self.expect("Identifier", error=SyntaxError("Expected identifier"))
+        if rt.error:
+            return RuntimeResult(None, rt.error)
+        
         identifier = rt.result.value
 
         rt = self.expect("With", error=SyntaxError("Expected 'with'"))
@@ -122,13 +152,65 @@ class Parser:
             return RuntimeResult(None, rt.error)
         
         if not self.in_end(self.at()):
-            return RuntimeResult(None, SyntaxError(f"Expected newline, got '{self.at().type.type}'"))
+            return RuntimeResult(None, SyntaxError(f"Expected newline, got '{self.at().type.type}'", self.at().position))
 
-        return RuntimeResult(UpdateStatement(identifier, rt.result), None)
+        return RuntimeResult(UpdateStatement(identifier, rt.result, position), None)
 
     def parse_if_statement(self):
-        self.eat()
+        position = self.eat().position
+        rt = self.expect("If", error=SyntaxError("Expected 'if'"))
+        if rt.error:
+            return RuntimeResult(None, rt.error)
+        
+        rt = self.parse_if_branches(position)
+        if rt.error:
+            return RuntimeResult(None, rt.error)
         
+        return RuntimeResult(rt.result, None)
+
+    def parse_if_branches(self, position):
+        rt = self.parse_expression()
+        if rt.error:
+            return RuntimeResult(None, rt.error)
+        
+        condition = rt.result
+        if not self.in_end(self.at()):
+            return RuntimeResult(None, SyntaxError(f"Expected newline, got '{self.at().type.type}'", self.at().position))
+        
+        rt = self.parse_block("Else", "End")
+        if rt.error:
+            return RuntimeResult(None, rt.error)
+        
+        body = rt.result
+        else_body = []
+        if self.at().type.type == "Else":
+            self.eat()
+            if self.at().type.type == "If":
+                # else if chains share the closing 'end' of the outermost decision
+                rt = self.parse_if_branches(self.eat().position)
+                if rt.error:
+                    return RuntimeResult(None, rt.error)
+                
+                return RuntimeResult(IfStatement(condition, body, [rt.result], position), None)
+            
+            if not self.in_end(self.at()):
+                return RuntimeResult(None, SyntaxError(f"Expected newline, got '{self.at().type.type}'", self.at().position))
+            
+            rt = self.parse_block("End")
+            if rt.error:
+                return RuntimeResult(None, rt.error)
+            
+            else_body = rt.result
+        
+        rt = self.expect("End", error=SyntaxError("Expected 'end'"))
+        if rt.error:
+            return RuntimeResult(None, rt.error)
+        
+        if not self.in_end(self.at()):
+            return RuntimeResult(None, SyntaxError(f"Expected newline, got '{self.at().type.type}'", self.at().position))
+        
+        return RuntimeResult(IfStatement(condition, body, else_body, position), None)
+
 
     def parse_expression(self):
         rt = self.parse_additive_expression()
@@ -149,7 +231,7 @@ class Parser:
             if right.error:
                 return RuntimeResult(None, right.error)
             
-            left = BinaryExpression(left, operator.type.type, right.result)
+            left = BinaryExpression(left, operator.type.type, right.result, operator.position)
         
         return RuntimeResult(left, None)
     
@@ -165,7 +247,7 @@ class Parser:
             if right.error:
                 return RuntimeResult(None, right.error)
             
-            left = BinaryExpression(left, operator.type.type, right.result)
+            left = BinaryExpression(left, operator.type.type, right.result, operator.position)
         
         return RuntimeResult(left, None)
     
@@ -175,8 +257,9 @@ class Parser:
             return RuntimeResult(None, rt.error)
         
         elements = [rt.result]
+        positions = []
         while self.at().type.type == "Power":
-            self.eat()
+            positions += [self.eat().position]
             rt = self.parse_unary_expression()
             if rt.error:
                 return RuntimeResult(None, rt.error)
@@ -184,10 +267,11 @@ class Parser:
             elements += [rt.result]
         
         elements = elements[::-1]
+        positions = positions[::-1]
         left = None
-        for element in elements:
+        for index, element in enumerate(elements):
             if left:
-                left = BinaryExpression(element, "Power", left)
+                left = BinaryExpression(element, "Power", left, positions[index - 1])
             else:
                 left = element
         
@@ -202,6 +286,7 @@ class Parser:
             return RuntimeResult(rt.result, None)
         
         sign = "+"
+        position = self.at().position
         while self.at().type.type in ("Plus", "Minus"):
             operator = self.eat()
             if operator.type.type == "Minus":
@@ -211,23 +296,22 @@ class Parser:
         if rt.error:
             return RuntimeResult(None, rt.error)
         
-        return RuntimeResult(UnaryExpression(sign, rt.result), None)
+        return RuntimeResult(UnaryExpression(sign, rt.result, position), None)
     
     def parse_primary_expression(self):
         match self.at().type.type:
             case "Identifier":
-                return RuntimeResult(Identifier(self.eat().value), None)
+                token = self.eat()
+                return RuntimeResult(Identifier(token.value, token.position), None)
             case "Number":
-                return RuntimeResult(NumberLiteral(float(self.eat().value)), None)
+                token = self.eat()
+                return RuntimeResult(NumberLiteral(float(token.value), token.position), None)
             case "True":
-                self.eat()
-                return RuntimeResult(TrueLiteral(), None)
+                return RuntimeResult(TrueLiteral(self.eat().position), None)
             case "False":
-                self.eat()
-                return RuntimeResult(FalseLiteral(), None)
+                return RuntimeResult(FalseLiteral(self.eat().position), None)
             case "Null":
-                self.eat()
-                return RuntimeResult(NullLiteral(), None)
+                return RuntimeResult(NullLiteral(self.eat().position), None)
             case "OpenParen":
                 self.eat()
                 expression = self.parse_expression()
@@ -240,4 +324,4 @@ class Parser:
                 
                 return RuntimeResult(expression.result, None)
             case _:
-                return RuntimeResult(None, SyntaxError(f"Unexpected token found: '{self.at()}'"))
\ No newline at end of file
+                return RuntimeResult(None, SyntaxError(f"Unexpected token found: '{self.at()}'", self.at().position))
\ No newline at end of file
@@ -0,0 +1,94 @@
+import gc
+import tracemalloc
+from collections import Counter
+from contextlib import contextmanager, nullcontext
+
+from . import errors
+from .frontend import lexer, abstract_syntax_tree
+from .runtime import values
+
+# modules whose classes get their instances counted
+COUNTED_MODULES = tuple(module.__name__ for module in (errors, lexer, abstract_syntax_tree, values))
+
+class PhaseReport:
+    def __init__(self, name, peak_bytes, net_bytes, objects, gc_collections):
+        self.name = name
+        self.peak_bytes = peak_bytes
+        self.net_bytes = net_bytes
+        self.objects = objects
+        self.gc_collections = gc_collections
+
+    def as_dict(self):
+        return {
+            "name": self.name,
+            "peak_bytes": self.peak_bytes,
+            "net_bytes": self.net_bytes,
+            "objects": dict(self.objects),
+            "gc_collections": list(self.gc_collections)
+        }
+
+    def __repr__(self):
+        return f"(PHASE {self.name}: peak {'unknown' if self.peak_bytes is None else f'{self.peak_bytes}B'}, net {self.net_bytes}B, objects {dict(self.objects)}, gc {self.gc_collections})"
+
+class MemoryReport:
+    def __init__(self):
+        self.phases = []
+
+    def as_dict(self):
+        return {"phases": [phase.as_dict() for phase in self.phases]}
+
+    def __repr__(self):
+        return f"(MEMORY REPORT [\n\t{';\n\t'.join([phase.__repr__() for phase in self.phases])}\n])"
+
+class MemoryProfiler:
+    def __init__(self):
+        self.report = MemoryReport()
+
+    @contextmanager
+    def phase(self, name):
+        # counted before tracing starts so the scan itself does not show up in the byte counts
+        instances_before = count_instances()
+        started_tracing = not tracemalloc.is_tracing()
+        if started_tracing:
+            tracemalloc.start()
+
+        collections_before = [generation["collections"] for generation in gc.get_stats()]
+        current_before = tracemalloc.get_traced_memory()[0]
+        # the caller's own peak is never reset, so peak_bytes is only known when tracing started here
+        if started_tracing:
+            tracemalloc.reset_peak()
+        try:
+            yield
+        finally:
+            current_after, peak = tracemalloc.get_traced_memory()
+            collections_after = [generation["collections"] for generation in gc.get_stats()]
+            if started_tracing:
+                tracemalloc.stop()
+
+            instances_after = count_instances()
+
+            self.report.phases += [PhaseReport(
+                name,
+                peak - current_before if started_tracing else None,
+                current_after - current_before,
+                diff_instances(instances_before, instances_after),
+                [after - before for before, after in zip(collections_before, collections_after)]
+            )]
+
+def measure(profiler, name):
+    if profiler is None:
+        return nullcontext()
+
+    return profiler.phase(name)
+
+def count_instances():
+    # live instances per class, a phase reports the difference so nothing outside it is touched
+    counter = Counter()
+    for obj in gc.get_objects():
+        if type(obj).__module__ in COUNTED_MODULES:
+            counter[type(obj).__name__] += 1
+
+    return counter
+
+def diff_instances(before, after):
+    return {name: after[name] - before[name] for name in after | before if after[name] != before[name]}
@@ -0,0 +1,101 @@
+from collections import OrderedDict
+from itertools import count
+
+from ..errors import RuntimeResult
+from .interpreter import evaluate_unary_expression, evaluate_binary_expression
+
+# structure -> id, shared by every cache so an id always stands for the same expression
+STRUCTURES = {}
+MAX_STRUCTURES = 65536
+structure_ids = count()
+
+class ExpressionCache:
+    def __init__(self, max_size=1024):
+        self.max_size = max_size
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def evaluate(self, ast_node, environment):
+        rt = self.make_key(ast_node, environment)
+        if rt.error:
+            # let the interpreter produce the error, it is never cached
+            return self.compute(ast_node, environment)
+
+        key = rt.result
+        if key in self.entries:
+            self.hits += 1
+            self.entries.move_to_end(key)
+            return RuntimeResult(self.entries[key], None)
+
+        self.misses += 1
+        rt = self.compute(ast_node, environment)
+        if rt.error:
+            return RuntimeResult(None, rt.error)
+
+        self.entries[key] = rt.result
+        if len(self.entries) > self.max_size:
+            self.entries.popitem(last=False)
+
+        return RuntimeResult(rt.result, None)
+
+    def compute(self, ast_node, environment):
+        # subexpressions go through the cache as well
+        if ast_node.type.type == "UnaryExpression":
+            return evaluate_unary_expression(ast_node, environment, self)
+
+        return evaluate_binary_expression(ast_node, environment, self)
+
+    def make_key(self, ast_node, environment):
+        structure_id(ast_node)
+        values = []
+        for var_name in ast_node.cache_inputs:
+            rt = environment.lookup(var_name)
+            if rt.error:
+                return RuntimeResult(None, rt.error)
+
+            values += [(var_name, rt.result.type.type, getattr(rt.result, "value", None))]
+
+        # structural ids are shared between parses, so a re-parsed copy of the program shares entries
+        return RuntimeResult((ast_node.cache_id, tuple(values)), None)
+
+    def clear(self):
+        self.entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def __repr__(self):
+        return f"(EXPRESSION CACHE {len(self.entries)}/{self.max_size} entries, {self.hits} hits, {self.misses} misses)"
+
+def structure_id(ast_node):
+    # computed once and kept on the node, so it is freed together with the AST
+    if getattr(ast_node, "cache_id", None) is not None:
+        return ast_node.cache_id
+
+    match ast_node.type.type:
+        case "Identifier":
+            structure = ("Identifier", ast_node.var_name)
+            inputs = (ast_node.var_name,)
+        case "UnaryExpression":
+            structure = ("UnaryExpression", ast_node.sign, structure_id(ast_node.value))
+            inputs = ast_node.value.cache_inputs
+        case "BinaryExpression":
+            structure = ("BinaryExpression", ast_node.operator, structure_id(ast_node.left), structure_id(ast_node.right))
+            inputs = tuple(sorted(set(ast_node.left.cache_inputs) | set(ast_node.right.cache_inputs)))
+        case "NullLiteral":
+            structure = ("NullLiteral",)
+            inputs = ()
+        case _:
+            structure = (ast_node.type.type, ast_node.value)
+            inputs = ()
+
+    if structure not in STRUCTURES:
+        # ids are never reused, so dropping the table only costs misses, never wrong hits
+        if len(STRUCTURES) >= MAX_STRUCTURES:
+            STRUCTURES.clear()
+
+        STRUCTURES[structure] = next(structure_ids)
+
+    ast_node.cache_id = STRUCTURES[structure]
+    ast_node.cache_inputs = inputs
+    return ast_node.cache_id
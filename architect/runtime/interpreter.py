@@ -1,10 +1,17 @@
 from ..errors import RuntimeResult, MathError, InterpreterError, DataTypeError
 from .values import *
 
-def evaluate_program(ast_node, environment):
+def evaluate_program(ast_node, environment, cache=None):
+    rt = evaluate_block(ast_node.body, environment, cache)
+    if rt.error:
+        return RuntimeResult(None, rt.error)
+    
+    return RuntimeResult(rt.result, None)
+
+def evaluate_block(body, environment, cache=None):
     last_evaluated = None
-    for statement in ast_node.body:
-        rt = evaluate(statement, environment)
+    for statement in body:
+        rt = evaluate(statement, environment, cache)
         if rt.error:
             return RuntimeResult(None, rt.error)
         
@@ -12,10 +19,14 @@ def evaluate_program(ast_node, environment):
     
     return RuntimeResult(last_evaluated, None)
 
-def evaluate(ast_node, environment):
+def evaluate(ast_node, environment, cache=None):
+    if cache is not None and ast_node.type.type in ("UnaryExpression", "BinaryExpression"):
+        # expressions have no side effects, their results only depend on the variables they read
+        return cache.evaluate(ast_node, environment)
+
     match ast_node.type.type:
         case "Program":
-            rt = evaluate_program(ast_node, environment)
+            rt = evaluate_program(ast_node, environment, cache)
             if rt.error:
                 return RuntimeResult(None, rt.error)
             
@@ -37,34 +48,40 @@ def evaluate(ast_node, environment):
         case "NullLiteral":
             return RuntimeResult(Null(), None)
         case "UnaryExpression":
-            rt = evaluate_unary_expression(ast_node, environment)
+            rt = evaluate_unary_expression(ast_node, environment, cache)
             if rt.error:
                 return RuntimeResult(None, rt.error)
             
             return RuntimeResult(rt.result, None)
         case "BinaryExpression":
-            rt = evaluate_binary_expression(ast_node, environment)
+            rt = evaluate_binary_expression(ast_node, environment, cache)
             if rt.error:
                 return RuntimeResult(None, rt.error)
             
             return RuntimeResult(rt.result, None)
         case "AssignmentStatement":
-            rt = evaluate_variable_assignment(ast_node, environment)
+            rt = evaluate_variable_assignment(ast_node, environment, cache)
             if rt.error:
                 return RuntimeResult(None, rt.error)
             
             return RuntimeResult(rt.result, None)
         case "UpdateStatement":
-            rt = evaluate_variable_update(ast_node, environment)
+            rt = evaluate_variable_update(ast_node, environment, cache)
+            if rt.error:
+                return RuntimeResult(None, rt.error)
+            
+            return RuntimeResult(rt.result, None)
+        case "IfStatement":
+            rt = evaluate_if_statement(ast_node, environment, cache)
             if rt.error:
                 return RuntimeResult(None, rt.error)
             
             return RuntimeResult(rt.result, None)
         case _:
-            return RuntimeResult(None, InterpreterError(f"This AST node has not been setup for interpretion yet: {ast_node}"))
+            return RuntimeResult(None, InterpreterError(f"This AST node has not been setup for interpretion yet: {ast_node}", ast_node.position))
     
 def evaluate_identifier(ast_node, environment):
-    rt = environment.lookup(ast_node.var_name)
+    rt = environment.lookup(ast_node.var_name, ast_node.position)
     if rt.error:
         return RuntimeResult(None, rt.error)
     
@@ -73,8 +90,8 @@ def evaluate_identifier(ast_node, environment):
 def evaluate_number_literal(ast_node):
     return RuntimeResult(create_number(ast_node.value), None)
 
-def evaluate_unary_expression(ast_node, environment):
-    rt = evaluate(ast_node.value, environment)
+def evaluate_unary_expression(ast_node, environment, cache=None):
+    rt = evaluate(ast_node.value, environment, cache)
     if rt.error:
         return RuntimeResult(None, rt.error)
     
@@ -90,16 +107,16 @@ def evaluate_unary_expression(ast_node, environment):
             
             return RuntimeResult(rt.result, None)
         case _:
-            return RuntimeResult(None, DataTypeError(f"Unexpected unary operation for '{rt.result.type.type}'"))
+            return RuntimeResult(None, DataTypeError(f"Unexpected unary operation for '{rt.result.type.type}'", ast_node.position))
 
-def evaluate_binary_expression(ast_node, environment):
-    rt = evaluate(ast_node.left, environment)
+def evaluate_binary_expression(ast_node, environment, cache=None):
+    rt = evaluate(ast_node.left, environment, cache)
     if rt.error:
         return RuntimeResult(None, rt.error)
     
     left = rt.result
     
-    rt = evaluate(ast_node.right, environment)
+    rt = evaluate(ast_node.right, environment, cache)
     if rt.error:
         return RuntimeResult(None, rt.error)
     
@@ -110,58 +127,80 @@ def evaluate_binary_expression(ast_node, environment):
             match left.type.type:
                 case "number":
                     if right.type.type != "number":
-                        return RuntimeResult(None, DataTypeError(f"Unexpected operation between number and {right.type.type}"))
+                        return RuntimeResult(None, DataTypeError(f"Unexpected operation between number and {right.type.type}", ast_node.position))
                     
                     return RuntimeResult(create_number(left.value + right.value), None)
                 case _:
-                    return RuntimeResult(None, DataTypeError(f"Unexpected operation between number and {right.type.type}"))
+                    return RuntimeResult(None, DataTypeError(f"Unexpected operation between number and {right.type.type}", ast_node.position))
         case "Minus":
             if left.type.type != "number" or right.type.type != "number":
-                return RuntimeResult(None, DataTypeError(f"Unexpected operation between {left.type.type} and {right.type.type}"))
+                return RuntimeResult(None, DataTypeError(f"Unexpected operation between {left.type.type} and {right.type.type}", ast_node.position))
             
             return RuntimeResult(create_number(left.value - right.value), None)
         case "Multiply":
             if left.type.type != "number" or right.type.type != "number":
-                return RuntimeResult(None, DataTypeError(f"Unexpected operation between {left.type.type} and {right.type.type}"))
+                return RuntimeResult(None, DataTypeError(f"Unexpected operation between {left.type.type} and {right.type.type}", ast_node.position))
             
             return RuntimeResult(create_number(left.value * right.value), None)
         case "Divide":
             if left.type.type != "number" or right.type.type != "number":
-                return RuntimeResult(None, DataTypeError(f"Unexpected operation between {left.type.type} and {right.type.type}"))
+                return RuntimeResult(None, DataTypeError(f"Unexpected operation between {left.type.type} and {right.type.type}", ast_node.position))
             
             if right.value == 0:
-                return RuntimeResult(None, MathError(f"Cannot divide {left.value} by 0"))
+                return RuntimeResult(None, MathError(f"Cannot divide {left.value} by 0", ast_node.position))
             
             return RuntimeResult(create_number(left.value / right.value), None)
         case "Power":
             if left.type.type != "number" or right.type.type != "number":
-                return RuntimeResult(None, DataTypeError(f"Unexpected operation between {left.type.type} and {right.type.type}"))
+                return RuntimeResult(None, DataTypeError(f"Unexpected operation between {left.type.type} and {right.type.type}", ast_node.position))
             
             return RuntimeResult(create_number(left.value ** right.value), None)
 
-def evaluate_variable_assignment(ast_node, environment):
+def evaluate_variable_assignment(ast_node, environment, cache=None):
     var_name = ast_node.var_name
-    rt = evaluate(ast_node.value, environment)
+    rt = evaluate(ast_node.value, environment, cache)
     if rt.error:
         return RuntimeResult(None, rt.error)
     
-    rt = environment.assign(var_name, rt.result)
+    rt = environment.assign(var_name, rt.result, ast_node.position)
     if rt.error:
         return RuntimeResult(None, rt.error)
     
     return RuntimeResult(rt.result, None)
 
-def evaluate_variable_update(ast_node, environment):
+def evaluate_variable_update(ast_node, environment, cache=None):
     var_name = ast_node.var_name
-    rt = evaluate(ast_node.value, environment)
+    rt = evaluate(ast_node.value, environment, cache)
     if rt.error:
         return RuntimeResult(None, rt.error)
     
-    rt = environment.update(var_name, rt.result)
+    rt = environment.update(var_name, rt.result, ast_node.position)
     if rt.error:
         return RuntimeResult(None, rt.error)
     
     return RuntimeResult(None, None)
 
+def evaluate_if_statement(ast_node, environment, cache=None):
+    rt = evaluate(ast_node.condition, environment, cache)
+    if rt.error:
+        return RuntimeResult(None, rt.error)
+    
+    # only the taken branch is ever evaluated
+    body = ast_node.body if is_truthy(rt.result) else ast_node.else_body
+    rt = evaluate_block(body, environment, cache)
+    if rt.error:
+        return RuntimeResult(None, rt.error)
+    
+    return RuntimeResult(rt.result, None)
+
+def is_truthy(value):
+    match value.type.type:
+        case "boolean":
+            return value.value == "true"
+        case "number":
+            return value.value != 0
+        case _:
+            return False
+
 def create_number(value):
     return Number(int(value) if value % 1 == 0 else value)
\ No newline at end of file
@@ -5,12 +5,12 @@ class Environment:
         self.table = {}
         self.parent = parent
     
-    def lookup(self, var_name):
+    def lookup(self, var_name, position=None):
         if var_name not in self.table:
             if not self.parent:
-                return RuntimeResult(None, VariableError(f"Cannot get the value of variable {var_name} because it does not exist."))
+                return RuntimeResult(None, VariableError(f"Cannot get the value of variable {var_name} because it does not exist.", position))
 
-            rt = self.parent.resolve(var_name)
+            rt = self.parent.lookup(var_name, position)
             if rt.error:
                 return RuntimeResult(None, rt.error)
             
@@ -18,16 +18,16 @@ class Environment:
         
         return RuntimeResult(self.table[var_name], None)
 
-    def update(self, var_name, value):
+    def update(self, var_name, value, position=None):
         if var_name not in self.table:
-            return RuntimeResult(None, VariableError(f"Cannot update variable {var_name} because it does not exist."))
+            return RuntimeResult(None, VariableError(f"Cannot update variable {var_name} because it does not exist.", position))
         
         self.table[var_name] = value
         return RuntimeResult(None, None)
     
-    def assign(self, var_name, value):
+    def assign(self, var_name, value, position=None):
         if var_name in self.table:
-            return RuntimeResult(None, VariableError(f"Cannot assign variable {var_name} because it existS."))
+            return RuntimeResult(None, VariableError(f"Cannot assign variable {var_name} because it existS.", position))
         
         self.table.update({var_name: value})
         return RuntimeResult(None, None)
@@ -1,8 +1,23 @@
 import sys
+import json
 import architect
 
 file = input("Choose a file to run (don't need .arc): ")
 with open(f"{file}.arc") as sys.stdin:
   code = sys.stdin.read()
 
-architect.execute_code(code)
+# pass --memory to write a per-phase memory report as JSON to stderr, or --memory=<path> to write it to a file
+memory = [arg for arg in sys.argv[1:] if arg == "--memory" or arg.startswith("--memory=")]
+profiler = architect.MemoryProfiler() if memory else None
+try:
+  architect.execute_code(code, profiler)
+finally:
+  # errors exit through sys.exit, the report of the phases that ran is still written
+  if profiler:
+    path = memory[-1].partition("=")[2]
+    if path:
+      with open(path, "w") as report_file:
+        json.dump(profiler.report.as_dict(), report_file, indent=2)
+    else:
+      json.dump(profiler.report.as_dict(), sys.stderr, indent=2)
+      sys.stderr.write("\n")
@@ -0,0 +1,45 @@
+import architect
+from architect.runtime.values import Number
+
+def run(program, cache, **inputs):
+    environment = architect.Environment()
+    for var_name, value in inputs.items():
+        environment.assign(var_name, Number(value))
+    
+    return architect.evaluate(program, environment, cache)
+
+def parse(code):
+    return architect.Parser(architect.tokenize(code).result).produce_ast().result
+
+def test_changed_input_only_recomputes_what_reads_it():
+    program = parse("build frame total with screw price * count\nbuild frame ratio with screw count / divisor\ntotal + ratio\n")
+    cache = architect.ExpressionCache()
+
+    rt = run(program, cache, price=2, count=3, divisor=1)
+    assert rt.result.value == 9
+    assert (cache.hits, cache.misses) == (0, 3)
+
+    # only price changed, 'count / divisor' is reused
+    rt = run(program, cache, price=4, count=3, divisor=1)
+    assert rt.result.value == 15
+    assert (cache.hits, cache.misses) == (1, 5)
+
+def test_inner_subtree_is_reused():
+    program = parse("(a * b) + c\n")
+    cache = architect.ExpressionCache()
+
+    run(program, cache, a=2, b=3, c=1)
+    rt = run(program, cache, a=2, b=3, c=2)
+    assert rt.result.value == 8
+    assert (cache.hits, cache.misses) == (1, 3)
+
+def test_errors_are_not_cached():
+    program = parse("count / divisor\n")
+    cache = architect.ExpressionCache()
+
+    for _ in range(2):
+        rt = run(program, cache, count=3, divisor=0)
+        assert rt.error
+    
+    assert len(cache.entries) == 0
+    assert cache.misses == 2